@@ -25,10 +25,13 @@
 #import sys
 import os
 import copy
+import shlex
 import liblo
 import logging
 import pexpect
 from time import sleep
+from types import MappingProxyType
+from subprocess import Popen, PIPE
 from os.path import isfile, isdir, join
 from string import Template
 from collections import OrderedDict
@@ -59,8 +62,9 @@ class zynthian_basic_engine:
 
 		self.proc = None
 		self.proc_timeout = 20
+		self.proc_maxread = 65536
 		self.proc_start_sleep = None
-		self.command = command
+		self.command = command # argv list => ["/path/to/binary", "arg1", ...]
 		self.command_env = None
 		self.command_prompt = prompt
 
@@ -79,12 +83,13 @@ class zynthian_basic_engine:
 			try:
 
 				logging.debug("Command: {}".format(self.command))
-				if self.command_env:
-					self.proc=pexpect.spawn(self.command, timeout=self.proc_timeout, env=self.command_env)
-				else:
-					self.proc=pexpect.spawn(self.command, timeout=self.proc_timeout)
+				if not isinstance(self.command, list):
+					raise TypeError("command must be a list of arguments")
+
+				self.proc=pexpect.spawn(self.command[0], self.command[1:], timeout=self.proc_timeout, maxread=self.proc_maxread, env=self.command_env)
 
 				self.proc.delaybeforesend = 0
+				self.proc.delayafterread = None
 
 				output = self.proc_get_output()
 
@@ -97,12 +102,16 @@ class zynthian_basic_engine:
 				logging.error("Can't start engine {} => {}".format(self.name, err))
 
 
-	def stop(self):
+	def stop(self, wait=0.2):
 		if self.proc:
 			try:
 				logging.info("Stoping Engine " + self.name)
 				self.proc.terminate()
-				sleep(0.2)
+				# Wait for the process to exit, but no longer than needed
+				n=int(wait/0.01)
+				while n>0 and self.proc.isalive():
+					sleep(0.01)
+					n-=1
 				self.proc.terminate(True)
 				self.proc=None
 			except Exception as err:
@@ -167,6 +176,15 @@ class zynthian_engine(zynthian_basic_engine):
 	# Config variables
 	# ---------------------------------------------------------------------------
 
+	# Directory scan cache: path => (mtime_ns, [(dpath, dname), ...], [(fpath, fname), ...])
+	entrylist_cache={}
+
+	# get_cmdlist title translation: '_' => ' '
+	cmdlist_title_tr=bytes.maketrans(b'_', b' ')
+
+	# Remote display env cache: path => (mtime_ns, {var: value, ...})
+	remote_display_env_cache={}
+
 	# ---------------------------------------------------------------------------
 	# Initialization
 	# ---------------------------------------------------------------------------
@@ -206,19 +224,34 @@ class zynthian_engine(zynthian_basic_engine):
 		self.loading_snapshot=False
 		#TODO: OSC, IPC, ...
 
+	# Parsed once per file version and shared by all engine instances
+	@staticmethod
+	def get_remote_display_env(fpath="/root/.remote_display_env"):
+		try:
+			mtime=os.stat(fpath).st_mtime_ns
+			cached=zynthian_engine.remote_display_env_cache.get(fpath)
+			if cached and cached[0]==mtime:
+				return cached[1]
+
+			fvars={}
+			with open(fpath,"r") as fh:
+				for line in fh:
+					name, sep, value = line.strip().partition('=')
+					value=value.strip('"\'')
+					if sep and value: fvars[name]=value
+		except:
+			return { 'DISPLAY': "" }
+
+		fvars=MappingProxyType(fvars)
+		zynthian_engine.remote_display_env_cache[fpath]=(mtime,fvars)
+		return fvars
+
+
 	def config_remote_display(self):
-		fvars={}
 		if os.environ.get('ZYNTHIANX'):
-			fvars['DISPLAY']=os.environ.get('ZYNTHIANX')
+			fvars={ 'DISPLAY': os.environ.get('ZYNTHIANX') }
 		else:
-			try:
-				with open("/root/.remote_display_env","r") as fh:
-					lines = fh.readlines()
-					for line in lines:
-						parts=line.strip().split('=')
-						if len(parts)>=2 and parts[1]: fvars[parts[0]]=parts[1]
-			except:
-				fvars['DISPLAY']=""
+			fvars=self.get_remote_display_env()
 		if 'DISPLAY' not in fvars or not fvars['DISPLAY']:
 			logging.info("NO REMOTE DISPLAY")
 			return False
@@ -233,22 +266,27 @@ class zynthian_engine(zynthian_basic_engine):
 	# Loading GUI signalization
 	# ---------------------------------------------------------------------------
 
+	# Nested start/stop calls are coalesced: the GUI is only notified
+	# when the engine goes from idle to loading and back.
+
 	def start_loading(self):
 		self.loading=self.loading+1
-		if self.loading<1: self.loading=1
-		if self.zyngui:
-			self.zyngui.start_loading()
+		if self.loading<=1:
+			self.loading=1
+			if self.zyngui:
+				self.zyngui.start_loading()
 
 	def stop_loading(self):
-		self.loading=self.loading-1
-		if self.loading<0: self.loading=0
-		if self.zyngui:
-			self.zyngui.stop_loading()
+		if self.loading>0:
+			self.loading=self.loading-1
+			if self.loading==0 and self.zyngui:
+				self.zyngui.stop_loading()
 
 	def reset_loading(self):
-		self.loading=0
-		if self.zyngui:
-			self.zyngui.stop_loading()
+		if self.loading>0:
+			self.loading=0
+			if self.zyngui:
+				self.zyngui.stop_loading()
 
 	# ---------------------------------------------------------------------------
 	# Refresh Management
@@ -292,15 +330,44 @@ class zynthian_engine(zynthian_basic_engine):
 
 
 	def cb_osc_all(self, path, args, types, src):
-		logging.info("OSC MESSAGE '%s' from '%s'" % (path, src.url))
-		for a, t in zip(args, types):
-			logging.debug("argument of type '%s': %s" % (t, a))
+		logging.info("OSC MESSAGE '%s' from '%s'", path, src.url)
+		if logging.getLogger().isEnabledFor(logging.DEBUG):
+			logging.debug("OSC arguments => %s" % ", ".join("%s:%s" % (t, a) for a, t in zip(args, types)))
 
 
 	# ---------------------------------------------------------------------------
 	# Generating list from different sources
 	# ---------------------------------------------------------------------------
 
+	# Scan a directory once, returning sorted lists of (path, name) for its
+	# subdirectories and files. Results are cached until the directory's mtime changes.
+	@staticmethod
+	def get_entrylist(dp):
+		mtime=os.stat(dp).st_mtime_ns
+		try:
+			cached=zynthian_engine.entrylist_cache[dp]
+			if cached[0]==mtime:
+				return cached[1], cached[2]
+		except KeyError:
+			pass
+
+		dirs=[]
+		files=[]
+		with os.scandir(dp) as it:
+			for e in it:
+				if e.name.startswith('.'):
+					continue
+				if e.is_dir():
+					dirs.append((e.path,e.name))
+				elif e.is_file():
+					files.append((e.path,e.name))
+		dirs.sort(key=lambda d: d[1])
+		files.sort(key=lambda f: f[1])
+
+		zynthian_engine.entrylist_cache[dp]=(mtime,dirs,files)
+		return dirs, files
+
+
 	@staticmethod
 	def get_filelist(dpath, fext):
 		res=[]
@@ -312,12 +379,12 @@ class zynthian_engine(zynthian_basic_engine):
 			dp=dpd[1]
 			dn=dpd[0]
 			try:
-				for f in sorted(os.listdir(dp)):
-					if not f.startswith('.') and isfile(join(dp,f)) and f[-xlen:].lower()==fext:
+				for fpath, f in zynthian_engine.get_entrylist(dp)[1]:
+					if f[-xlen:].lower()==fext:
 						title=str.replace(f[:-xlen], '_', ' ')
 						if dn!='_': title=dn+'/'+title
 						#print("filelist => "+title)
-						res.append((join(dp,f),i,title,dn,f))
+						res.append((fpath,i,title,dn,f))
 						i=i+1
 			except:
 				pass
@@ -334,16 +401,16 @@ class zynthian_engine(zynthian_basic_engine):
 			dp=dpd[1]
 			dn=dpd[0]
 			try:
-				for f in sorted(os.listdir(dp)):
-					if next(os.scandir(join(dp,f)), None) is None:
-						continue
-					if not f.startswith('.') and isdir(join(dp,f)):
-						title,ext=os.path.splitext(f)
-						title=str.replace(title, '_', ' ')
-						if dn!='_': title=dn+'/'+title
-						#print("dirlist => "+title)
-						res.append((join(dp,f),i,title,dn,f))
-						i=i+1
+				for fpath, f in zynthian_engine.get_entrylist(dp)[0]:
+					with os.scandir(fpath) as it:
+						if next(it, None) is None:
+							continue
+					title,ext=os.path.splitext(f)
+					title=str.replace(title, '_', ' ')
+					if dn!='_': title=dn+'/'+title
+					#print("dirlist => "+title)
+					res.append((fpath,i,title,dn,f))
+					i=i+1
 			except:
 				pass
 
@@ -353,13 +420,12 @@ class zynthian_engine(zynthian_basic_engine):
 	@staticmethod
 	def get_cmdlist(cmd):
 		res=[]
-		i=0
-		output=check_output(cmd, shell=True)
-		lines=output.decode('utf8').split('\n')
-		for f in lines:
-			title=str.replace(f, '_', ' ')
-			res.append((f,i,title))
-			i=i+1
+		if isinstance(cmd, str): cmd=shlex.split(cmd)
+		tr=zynthian_engine.cmdlist_title_tr
+		with Popen(cmd, stdout=PIPE) as proc:
+			for i, line in enumerate(proc.stdout):
+				f=line.rstrip(b'\n')
+				res.append((f.decode('utf8','replace'),i,f.translate(tr).decode('utf8','replace')))
 		return res
 
 
@@ -84,10 +84,10 @@ class zynthian_engine_csound(zynthian_engine):
 
 		if self.config_remote_display():
 			self.nogui = False
-			self.base_command="/usr/bin/csound -+rtaudio=jack -+rtmidi=alsaseq -M14 -o dac"
+			self.base_command=["/usr/bin/csound", "-+rtaudio=jack", "-+rtmidi=alsaseq", "-M14", "-o", "dac"]
 		else:
 			self.nogui = True
-			self.base_command="/usr/bin/csound --nodisplays -+rtaudio=jack -+rtmidi=alsaseq -M14 -o dac"
+			self.base_command=["/usr/bin/csound", "--nodisplays", "-+rtaudio=jack", "-+rtmidi=alsaseq", "-M14", "-o", "dac"]
 
 		self.reset()
 
@@ -120,7 +120,7 @@ class zynthian_engine_csound(zynthian_engine):
 
 	def set_preset(self, layer, preset, preload=False):
 		self.load_preset_config(preset[0])
-		self.command=self.base_command+ " " + self.get_fixed_preset_filepath(preset[0], layer.midi_chan)
+		self.command=self.base_command + [self.get_fixed_preset_filepath(preset[0], layer.midi_chan)]
 		self.preset=preset[0]
 		self.stop()
 		self.start()
@@ -51,7 +51,7 @@ class zynthian_engine_fluidsynth(zynthian_engine):
 	# Config variables
 	# ---------------------------------------------------------------------------
 
-	fs_options = "-o synth.midi-bank-select=mma -o synth.cpu-cores=3 -o synth.polyphony=64"
+	fs_options = ["-o", "synth.midi-bank-select=mma", "-o", "synth.cpu-cores=3", "-o", "synth.polyphony=64"]
 
 	soundfont_dirs=[
 		('EX', zynthian_engine.ex_data_dir + "/soundfonts/sf2"),
@@ -69,7 +69,7 @@ class zynthian_engine_fluidsynth(zynthian_engine):
 		self.nickname = "FS"
 		self.jackname = "fluidsynth"
 
-		self.command = "/usr/local/bin/fluidsynth -p fluidsynth -a jack -m jack -g 1 -j {}".format(self.fs_options)
+		self.command = ["/usr/local/bin/fluidsynth", "-p", "fluidsynth", "-a", "jack", "-m", "jack", "-g", "1", "-j"] + self.fs_options
 		self.command_prompt = "\n> "
 
 		self.start()
@@ -171,12 +171,12 @@ class zynthian_engine_jalv(zynthian_engine):
 		self.learned_zctrls = {}
 
 		if no_plugin_instance:
-			self.command = ("/usr/local/bin/jalv -z {}".format(self.plugin_url))
+			self.command = ["/usr/local/bin/jalv", "-z", self.plugin_url]
 		else:
 			if self.config_remote_display():
-				self.command = ("/usr/local/bin/jalv {}".format(self.plugin_url))		#TODO => Is possible to run plugin's UI?
+				self.command = ["/usr/local/bin/jalv", self.plugin_url]		#TODO => Is possible to run plugin's UI?
 			else:
-				self.command = ("/usr/local/bin/jalv {}".format(self.plugin_url))
+				self.command = ["/usr/local/bin/jalv", self.plugin_url]
 
 		self.command_prompt = "\n> "
 
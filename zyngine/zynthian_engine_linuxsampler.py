@@ -97,7 +97,7 @@ class zynthian_engine_linuxsampler(zynthian_engine):
 		self.jackname = "LinuxSampler"
 
 		self.sock = None
-		self.command = "linuxsampler --lscp-port {}".format(self.lscp_port)
+		self.command = ["linuxsampler", "--lscp-port", str(self.lscp_port)]
 		self.command_prompt = "\nLinuxSampler initialization completed."
 
 		self.ls_chans = {}
@@ -361,15 +361,15 @@ class zynthian_engine_pianoteq(zynthian_engine):
 			self.proc_start_sleep = 5
 			self.command_prompt = None
 			if PIANOTEQ_VERSION[0]==6 and PIANOTEQ_VERSION[1]==0:
-				self.base_command = PIANOTEQ_BINARY
+				self.base_command = [PIANOTEQ_BINARY]
 			else:
-				self.base_command = PIANOTEQ_BINARY + " --multicore max"
+				self.base_command = [PIANOTEQ_BINARY, "--multicore", "max"]
 		else:
 			self.command_prompt = "Current preset:"
 			if PIANOTEQ_VERSION[0]==6 and PIANOTEQ_VERSION[1]==0:
-				self.base_command = PIANOTEQ_BINARY + " --headless"
+				self.base_command = [PIANOTEQ_BINARY, "--headless"]
 			else:
-				self.base_command = PIANOTEQ_BINARY + " --headless --multicore max"
+				self.base_command = [PIANOTEQ_BINARY, "--headless", "--multicore", "max"]
 
 		# Create & fix Pianoteq config
 		if not os.path.isfile(PIANOTEQ_CONFIG_FILE):
@@ -412,7 +412,7 @@ class zynthian_engine_pianoteq(zynthian_engine):
 
 	def set_midi_chan(self, layer):
 		self.stop()
-		self.command = self.base_command + ("--midi-channel", str(layer.get_midi_chan()+1),)
+		self.command = self.base_command + ["--midi-channel", str(layer.get_midi_chan()+1)]
 
 	#----------------------------------------------------------------------------
 	# Bank Managament
@@ -478,9 +478,11 @@ class zynthian_engine_pianoteq(zynthian_engine):
 		#Get internal presets from Pianoteq ...
 		try:
 			pianoteq=subprocess.Popen([PIANOTEQ_BINARY, "--list-presets"],stdout=subprocess.PIPE)
+			#Read & decode the whole preset dump at once, then split lines
+			output=pianoteq.communicate()[0].decode("utf-8","replace")
 			bank_list = sorted(self.bank_list, key=lambda bank: len(bank[0]) if bank[0] else 0, reverse=True)
-			for line in pianoteq.stdout:
-				l=line.rstrip().decode("utf-8")
+			for l in output.split("\n"):
+				l=l.rstrip()
 				logging.debug("PRESET => {}".format(l))
 				for bank in bank_list:
 					try:
@@ -613,9 +615,9 @@ class zynthian_engine_pianoteq(zynthian_engine):
 		else:
 			self.midimapping=mm
 			self.preset=preset[0]
-			self.command = self.base_command + " --midi-channel {}".format(layer.get_midi_chan()+1)
-			self.command += " --midimapping \"{}\"".format(self.midimapping)
-			self.command += " --preset \"{}\"".format(preset[0])
+			self.command = self.base_command + ["--midi-channel", str(layer.get_midi_chan()+1)]
+			self.command += ["--midimapping", self.midimapping]
+			self.command += ["--preset", preset[0]]
 			self.stop()
 			self.start()
 			self.zyngui.zynautoconnect(True)
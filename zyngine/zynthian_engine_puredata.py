@@ -85,9 +85,9 @@ class zynthian_engine_puredata(zynthian_engine):
 		self.preset_config = None
 
 		if self.config_remote_display():
-			self.base_command="/usr/bin/pd -jack -rt -alsamidi -mididev 1 -open \"{}\"".format(self.startup_patch)
+			self.base_command=["/usr/bin/pd", "-jack", "-rt", "-alsamidi", "-mididev", "1", "-open", self.startup_patch]
 		else:
-			self.base_command="/usr/bin/pd -nogui -jack -rt -alsamidi -mididev 1 -open \"{}\"".format(self.startup_patch)
+			self.base_command=["/usr/bin/pd", "-nogui", "-jack", "-rt", "-alsamidi", "-mididev", "1", "-open", self.startup_patch]
 
 		self.reset()
 
@@ -120,7 +120,7 @@ class zynthian_engine_puredata(zynthian_engine):
 
 	def set_preset(self, layer, preset, preload=False):
 		self.load_preset_config(preset)
-		self.command=self.base_command+ " " + self.get_preset_filepath(preset)
+		self.command=self.base_command + [self.get_preset_filepath(preset)]
 		self.preset=preset[0]
 		self.stop()
 		self.start()
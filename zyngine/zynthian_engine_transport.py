@@ -32,7 +32,7 @@ from . import zynthian_basic_engine
 class zynthian_engine_transport(zynthian_basic_engine):
 
 	def __init__(self):
-		super().__init__("JackTransport", "/usr/local/bin/jack_transport", "jack_transport>")
+		super().__init__("JackTransport", ["/usr/local/bin/jack_transport"], "jack_transport>")
 		
 		self.start()
 		self.proc_cmd("master")
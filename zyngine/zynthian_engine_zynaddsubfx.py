@@ -112,9 +112,9 @@ class zynthian_engine_zynaddsubfx(zynthian_engine):
 		self.osc_target_port = 6693
 
 		if self.config_remote_display():
-			self.command = "/usr/local/bin/zynaddsubfx -O jack-multi -I jack -P {} -a".format(self.osc_target_port)
+			self.command = ["/usr/local/bin/zynaddsubfx", "-O", "jack-multi", "-I", "jack", "-P", str(self.osc_target_port), "-a"]
 		else:
-			self.command = "/usr/local/bin/zynaddsubfx -O jack-multi -I jack -P {} -a -U".format(self.osc_target_port)
+			self.command = ["/usr/local/bin/zynaddsubfx", "-O", "jack-multi", "-I", "jack", "-P", str(self.osc_target_port), "-a", "-U"]
 
 		self.command_prompt = "\n\\[INFO] Main Loop..."
 
@@ -173,20 +173,21 @@ class zynthian_engine_zynaddsubfx(zynthian_engine):
 		preset_dir=bank[0]
 		index=0
 		logging.info("Getting Preset List for %s" % bank[2])
-		for f in sorted(os.listdir(preset_dir)):
-			preset_fpath=join(preset_dir,f)
+		with os.scandir(preset_dir) as it:
+			entries=sorted((e for e in it if e.name[-3:].lower() in ('xiz','xmz','xsz','xlz') and e.is_file()), key=lambda e: e.name)
+		for e in entries:
+			f=e.name
 			ext=f[-3:].lower()
-			if (isfile(preset_fpath) and (ext=='xiz' or ext=='xmz' or ext=='xsz' or ext=='xlz')):
-				try:
-					index=int(f[0:4])-1
-					title=str.replace(f[5:-4], '_', ' ')
-				except:
-					index+=1
-					title=str.replace(f[0:-4], '_', ' ')
-				bank_lsb=int(index/128)
-				bank_msb=bank[1]
-				prg=index%128
-				preset_list.append((preset_fpath,[bank_msb,bank_lsb,prg],title,ext,f))
+			try:
+				index=int(f[0:4])-1
+				title=str.replace(f[5:-4], '_', ' ')
+			except:
+				index+=1
+				title=str.replace(f[0:-4], '_', ' ')
+			bank_lsb=int(index/128)
+			bank_msb=bank[1]
+			prg=index%128
+			preset_list.append((e.path,[bank_msb,bank_lsb,prg],title,ext,f))
 		return preset_list
 
 
@@ -254,15 +255,21 @@ class zynthian_engine_zynaddsubfx(zynthian_engine):
 
 
 	def enable_layer_parts(self):
+		bundle=liblo.Bundle()
 		for layer in self.layers:
-			self.enable_part(layer)
+			if layer.part_i is not None:
+				bundle.add("/part%d/Penabled" % layer.part_i, True)
+				bundle.add("/part%d/Prcvchn" % layer.part_i, layer.get_midi_chan())
 		for i in self.get_free_parts():
-			self.disable_part(i)
+			bundle.add("/part%d/Penabled" % i, False)
+		liblo.send(self.osc_target, bundle)
 
 
 	def disable_all_parts(self):
+		bundle=liblo.Bundle()
 		for i in range(0,16):
-			self.disable_part(i)
+			bundle.add("/part%d/Penabled" % i, False)
+		liblo.send(self.osc_target, bundle)
 
 	#----------------------------------------------------------------------------
 	# OSC Managament
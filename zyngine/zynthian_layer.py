@@ -58,6 +58,8 @@ class zynthian_layer:
 		self.preload_info = None
 
 		self.controllers_dict = None
+		self.midi_cc_zctrls = []
+		self.midi_cc_index = {}
 		self.ctrl_screens_dict = None
 		self.active_screen_index = -1
 
@@ -113,6 +115,28 @@ class zynthian_layer:
 		return self.midi_chan
 
 
+	# ---------------------------------------------------------------------------
+	# Bank & Preset info cloning
+	# ---------------------------------------------------------------------------
+
+
+	# Bank/preset list entries are nested lists/tuples/dicts of plain values,
+	# so they can be cloned without deepcopy's memo & dispatch machinery.
+	@staticmethod
+	def clone_info(info):
+		t=type(info)
+		if t is tuple:
+			return tuple(zynthian_layer.clone_info(v) for v in info)
+		elif t is list:
+			return [zynthian_layer.clone_info(v) for v in info]
+		elif t is dict:
+			return {k: zynthian_layer.clone_info(v) for k, v in info.items()}
+		elif t in (str, int, float, bool) or info is None:
+			return info
+		else:
+			return copy.deepcopy(info)
+
+
 	# ---------------------------------------------------------------------------
 	# Bank Management
 	# ---------------------------------------------------------------------------
@@ -135,7 +159,7 @@ class zynthian_layer:
 			last_bank_name=self.bank_name
 			self.bank_index=i
 			self.bank_name=self.bank_list[i][2]
-			self.bank_info=copy.deepcopy(self.bank_list[i])
+			self.bank_info=self.clone_info(self.bank_list[i])
 			logging.info("Bank Selected: %s (%d)" % (self.bank_name,i))
 
 			if set_engine and (last_bank_index!=i or not last_bank_name):
@@ -186,7 +210,7 @@ class zynthian_layer:
 			last_preset_name=self.preset_name
 			self.preset_index=i
 			self.preset_name=self.preset_list[i][2]
-			self.preset_info=copy.deepcopy(self.preset_list[i])
+			self.preset_info=self.clone_info(self.preset_list[i])
 			self.preset_bank_index=self.bank_index
 
 			logging.info("Preset Selected: %s (%d)" % (self.preset_name,i))
@@ -228,7 +252,7 @@ class zynthian_layer:
 		if i < len(self.preset_list) and (self.preload_info==None or not self.engine.cmp_presets(self.preload_info,self.preset_list[i])):
 			self.preload_index=i
 			self.preload_name=self.preset_list[i][2]
-			self.preload_info=copy.deepcopy(self.preset_list[i])
+			self.preload_info=self.clone_info(self.preset_list[i])
 			logging.info("Preset Preloaded: %s (%d)" % (self.preload_name,i))
 			self.engine.set_preset(self,self.preload_info,True)
 			return True
@@ -268,6 +292,13 @@ class zynthian_layer:
 
 	def init_controllers(self):
 		self.controllers_dict=self.engine.get_controllers_dict(self)
+		#Pre-select MIDI-CC controllers, so send_ctrl_midi_cc doesn't need to test every controller
+		self.midi_cc_zctrls=[(k, zctrl) for k, zctrl in self.controllers_dict.items() if zctrl.midi_cc]
+		#Index controllers by MIDI-CC number for fast lookup on incoming CC messages
+		self.midi_cc_index={}
+		for zctrl in self.controllers_dict.values():
+			if zctrl.midi_cc is not None:
+				self.midi_cc_index.setdefault(zctrl.midi_cc, []).append(zctrl)
 
 
 	# Create controller screens from zynthian controller keys
@@ -315,10 +346,10 @@ class zynthian_layer:
 
 
 	def send_ctrl_midi_cc(self):
-		for k, zctrl in self.controllers_dict.items():
-			if zctrl.midi_cc:
-				self.zyngui.zynmidi.set_midi_control(zctrl.midi_chan, zctrl.midi_cc, int(zctrl.value))
-				logging.debug("Sending MIDI CC{}={} for {}".format(zctrl.midi_cc, zctrl.value, k))
+		set_midi_control=self.zyngui.zynmidi.set_midi_control
+		for k, zctrl in self.midi_cc_zctrls:
+			set_midi_control(zctrl.midi_chan, zctrl.midi_cc, int(zctrl.value))
+			logging.debug("Sending MIDI CC{}={} for {}".format(zctrl.midi_cc, zctrl.value, k))
 
 
 	#----------------------------------------------------------------------------
@@ -329,14 +360,12 @@ class zynthian_layer:
 	def midi_control_change(self, chan, ccnum, ccval):
 		if self.engine:
 			if self.listen_midi_cc and chan==self.midi_chan:
-				#TODO => Optimize!!
-				for k, zctrl in self.controllers_dict.items():
-					if zctrl.midi_cc==ccnum:
-						try:
-							# Aeolus, FluidSynth, LinuxSampler, puredata, Pianoteq, setBfree, ZynAddSubFX
-							self.engine.midi_zctrl_change(zctrl, ccval)
-						except:
-							pass
+				for zctrl in self.midi_cc_index.get(ccnum, ()):
+					try:
+						# Aeolus, FluidSynth, LinuxSampler, puredata, Pianoteq, setBfree, ZynAddSubFX
+						self.engine.midi_zctrl_change(zctrl, ccval)
+					except:
+						pass
 
 			elif not self.listen_midi_cc:
 				try:
@@ -440,7 +440,9 @@ class zynthian_gui_layer(zynthian_gui_selector):
 
 	def midi_control_change(self, chan, ccnum, ccval):
 		for layer in self.layers:
-			layer.midi_control_change(chan, ccnum, ccval)
+			# Only layers listening on this channel, or getting raw CCs (Jalv), are interested
+			if layer.midi_chan==chan or not layer.listen_midi_cc:
+				layer.midi_control_change(chan, ccnum, ccval)
 
 
 	#----------------------------------------------------------------------------